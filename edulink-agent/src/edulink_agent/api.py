@@ -2,21 +2,93 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from fastapi import FastAPI, HTTPException
+import time
+
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from .config import ServiceInfo, Settings
+from .browser_pool import BrowserPool
+from .config import ServiceInfo, Settings, get_settings
 from .conversation import answer_question
 from .models import EdulinkReport
 from .scraper import collect_report
 from .summariser import build_summary
-from .utils import now_in_timezone
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
-app = FastAPI(title="Edulink Agent", version="0.1.0")
+app = FastAPI(title="Edulink Agent", version="0.1.0", default_response_class=ORJSONResponse)
+
+# Most recent report and the monotonic time it was scraped; shared by /report and /chat.
+REPORT_CACHE: tuple[float, EdulinkReport] | None = None
+_REPORT_LOCK = asyncio.Lock()
+
+
+@app.on_event("startup")
+async def configure_logging() -> None:
+    """Configure logging in the serving process rather than at import time."""
+
+    logging.basicConfig(level=logging.INFO)
+
+
+@app.on_event("startup")
+async def start_browser_pool() -> None:
+    """Launch the shared browser pool once per process."""
+
+    pool = BrowserPool(get_settings())
+    await pool.start()
+    app.state.browser_pool = pool
+
+
+@app.on_event("shutdown")
+async def stop_browser_pool() -> None:
+    """Close pooled browsers when the service stops."""
+
+    pool: BrowserPool | None = getattr(app.state, "browser_pool", None)
+    if pool is not None:
+        await pool.close()
+
+
+async def get_or_build_report(settings: Settings, pool: BrowserPool) -> EdulinkReport:
+    """Return the cached report while it is fresh, otherwise scrape a new one.
+
+    Concurrent callers wait on the same lock, so a burst of requests triggers a single scrape.
+    With caching disabled there is nothing to share, so each request scrapes independently.
+    """
+
+    global REPORT_CACHE
+
+    if settings.report_cache_ttl_seconds <= 0:
+        return await _build_report(settings, pool)
+
+    async with _REPORT_LOCK:
+        if REPORT_CACHE and time.monotonic() - REPORT_CACHE[0] < settings.report_cache_ttl_seconds:
+            logger.info("Serving cached report")
+            return REPORT_CACHE[1]
+
+        report = await _build_report(settings, pool)
+        REPORT_CACHE = (time.monotonic(), report)
+        return report
+
+
+async def _build_report(settings: Settings, pool: BrowserPool) -> EdulinkReport:
+    """Scrape a fresh report and attach its summary."""
+
+    report = await collect_report(settings, pool)
+    report.summary_text = build_summary(report)
+    return report
+
+
+async def current_report(settings: Settings = Depends(get_settings)) -> EdulinkReport:
+    """FastAPI dependency resolving the latest (possibly cached) report."""
+
+    try:
+        return await get_or_build_report(settings, app.state.browser_pool)
+    except Exception as exc:
+        logger.exception("Failed to build Edulink report: %s", exc)
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 class ReportResponse(BaseModel):
@@ -42,42 +114,39 @@ class ChatResponse(BaseModel):
 
 
 @app.post("/report", response_model=ReportResponse)
-async def generate_report() -> ReportResponse:
-    """Generate an Edulink report and return the structured payload."""
-
-    logger.info("Received /report request")
-    settings = Settings()
-    try:
-        report = await collect_report(settings)
-        report.summary_text = build_summary(report)
-    except Exception as exc:
-        logger.exception("Failed to build Edulink report: %s", exc)
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+async def generate_report(
+    report: EdulinkReport = Depends(current_report),
+    settings: Settings = Depends(get_settings),
+) -> ORJSONResponse:
+    """Return the latest Edulink report and its structured payload."""
 
     info = ServiceInfo(
-        generated_at=now_in_timezone(settings.timezone).isoformat(),
+        generated_at=report.generated_at.isoformat(),
         timezone=settings.timezone,
     )
-    logger.info("Successfully generated report")
-    return ReportResponse(summary=report.summary_text, report=report, info=info)
+    logger.info("Served /report request")
+    response = ReportResponse(summary=report.summary_text, report=report, info=info)
+    return ORJSONResponse(content=response.model_dump(mode="json", by_alias=True))
 
 
 @app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
+async def chat(
+    request: ChatRequest,
+    settings: Settings = Depends(get_settings),
+) -> ORJSONResponse:
     """Answer a conversational query about the most recent Edulink data."""
 
-    logger.info("Received /chat request: %s", request.question)
-    settings = Settings()
-    try:
-        report = await collect_report(settings)
-        report.summary_text = build_summary(report)
-    except Exception as exc:
-        logger.exception("Failed to build Edulink report for chat: %s", exc)
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    # Resolved here rather than as a dependency so a malformed body is rejected before any scrape.
+    report = await current_report(settings)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Chat question (%s chars): %s", len(request.question), request.question)
 
     reply = answer_question(report, request.question)
     info = ServiceInfo(
-        generated_at=now_in_timezone(settings.timezone).isoformat(),
+        generated_at=report.generated_at.isoformat(),
         timezone=settings.timezone,
     )
-    return ChatResponse(reply=reply, report=report, info=info)
+    logger.info("Served /chat request")
+    response = ChatResponse(reply=reply, report=report, info=info)
+    return ORJSONResponse(content=response.model_dump(mode="json", by_alias=True))
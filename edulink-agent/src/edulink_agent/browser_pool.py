@@ -0,0 +1,129 @@
+"""Pool of pre-warmed Chromium browsers shared across scrape requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+from .config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Delay between attempts to replace a browser whose relaunch failed.
+RELAUNCH_RETRY_SECONDS = 5.0
+
+
+class BrowserPool:
+    """Keep a fixed number of Chromium instances alive and hand them out on demand."""
+
+    def __init__(self, settings: Settings, size: Optional[int] = None, recycle_after: Optional[int] = None):
+        self._headless = settings.headless
+        self._size = max(1, size if size is not None else settings.browser_pool_size)
+        self._recycle_after = recycle_after if recycle_after is not None else settings.browser_pool_recycle_after
+        self._acquire_timeout = settings.browser_pool_acquire_timeout_seconds
+        self._playwright: Optional[Playwright] = None
+        self._queue: asyncio.Queue[Browser] = asyncio.Queue()
+        self._uses: Dict[int, int] = {}
+        self._relaunches: Set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start Playwright and launch the configured number of browsers."""
+
+        if self._playwright is not None:
+            return
+        logger.info("Starting browser pool size=%s recycle_after=%s", self._size, self._recycle_after)
+        self._playwright = await async_playwright().start()
+        browsers = await asyncio.gather(*(self._launch() for _ in range(self._size)))
+        for browser in browsers:
+            self._queue.put_nowait(browser)
+
+    async def close(self) -> None:
+        """Close every pooled browser and stop Playwright."""
+
+        for task in self._relaunches:
+            task.cancel()
+        await asyncio.gather(*self._relaunches, return_exceptions=True)
+        while not self._queue.empty():
+            browser = self._queue.get_nowait()
+            self._uses.pop(id(browser), None)
+            await browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("Browser pool closed")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Browser]:
+        """Borrow a browser for the duration of the ``async with`` block."""
+
+        if self._playwright is None:
+            raise RuntimeError("Browser pool has not been started")
+
+        try:
+            browser = await asyncio.wait_for(self._queue.get(), timeout=self._acquire_timeout)
+        except asyncio.TimeoutError as exc:
+            raise RuntimeError(f"No pooled browser became available within {self._acquire_timeout}s") from exc
+        try:
+            yield browser
+        finally:
+            await self._release(browser)
+
+    async def _release(self, browser: Browser) -> None:
+        """Return a browser to the pool, relaunching it once it has served enough requests."""
+
+        key = id(browser)
+        self._uses[key] = self._uses.get(key, 0) + 1
+        if browser.is_connected() and (not self._recycle_after or self._uses[key] < self._recycle_after):
+            self._queue.put_nowait(browser)
+            return
+
+        logger.info("Recycling pooled browser after %s uses", self._uses.pop(key))
+        try:
+            await browser.close()
+        except Exception as exc:  # pragma: no cover - browser already gone
+            logger.warning("Failed to close recycled browser: %s", exc)
+        try:
+            self._queue.put_nowait(await self._launch())
+        except Exception as exc:
+            # The caller's report already succeeded; replace the browser in the background instead.
+            logger.warning("Failed to relaunch pooled browser, retrying in background: %s", exc)
+            task = asyncio.create_task(self._relaunch_until_ready())
+            self._relaunches.add(task)
+            task.add_done_callback(self._relaunches.discard)
+
+    async def _relaunch_until_ready(self) -> None:
+        """Keep trying to launch a replacement browser so the pool stays at its configured size."""
+
+        while self._playwright is not None:
+            await asyncio.sleep(RELAUNCH_RETRY_SECONDS)
+            try:
+                self._queue.put_nowait(await self._launch())
+                return
+            except Exception as exc:
+                logger.warning("Relaunching pooled browser failed: %s", exc)
+
+    async def _launch(self) -> Browser:
+        """Launch Chromium with sensible defaults."""
+
+        assert self._playwright is not None
+        logger.info("Launching Chromium headless=%s", self._headless)
+        browser = await self._playwright.chromium.launch(
+            headless=self._headless,
+            args=[
+                "--disable-dev-shm-usage",
+                "--no-sandbox",
+            ],
+        )
+        self._uses[id(browser)] = 0
+        return browser
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from pathlib import Path
+
 from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,6 +24,32 @@ class Settings(BaseSettings):
     timeout_seconds: int = Field(default=30, validation_alias="EDULINK_TIMEOUT_SECONDS")
     timezone: str = Field(default="Europe/London", validation_alias="EDULINK_TIMEZONE")
     child_name: str | None = Field(default=None, validation_alias="EDULINK_CHILD_NAME")
+    storage_state_path: Path | None = Field(
+        default=None,
+        validation_alias="EDULINK_STORAGE_STATE_PATH",
+        description="Optional file used to persist the logged-in browser session between reports.",
+    )
+    report_cache_ttl_seconds: int = Field(
+        default=60,
+        validation_alias="EDULINK_REPORT_CACHE_TTL_SECONDS",
+        description="How long the API reuses a scraped report before scraping again (0 disables caching).",
+    )
+    browser_pool_size: int = Field(
+        default=1,
+        validation_alias="EDULINK_BROWSER_POOL_SIZE",
+        description="Chromium instances kept warm by the API; only useful above 1 when the report cache is disabled.",
+    )
+    browser_pool_recycle_after: int = Field(
+        default=100,
+        validation_alias="EDULINK_BROWSER_POOL_RECYCLE_AFTER",
+        description="Relaunch a pooled browser after serving this many reports (0 disables recycling).",
+    )
+
+    browser_pool_acquire_timeout_seconds: float = Field(
+        default=120,
+        validation_alias="EDULINK_BROWSER_POOL_ACQUIRE_TIMEOUT_SECONDS",
+        description="How long a request waits for a pooled browser before failing.",
+    )
 
     model_config = SettingsConfigDict(
         env_file=(".env",),
@@ -30,6 +59,12 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsed from the environment once."""
+    return Settings()
+
+
 class ServiceInfo(BaseModel):
     """Metadata returned by the API/CLI."""
 
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import re
 from typing import List
 
 from .models import EdulinkReport, HomeworkItem, BehaviourEntry, MailEntry
 
+# One case-insensitive pass finds every topic keyword; answer_question then applies topic priority.
+_TOPIC_RE = re.compile(
+    r"(?P<homework>homework|assignment|tasks)"
+    r"|(?P<behaviour>behaviour|behavior|achievement|points)"
+    r"|(?P<mail>mail|email|message|communicator|inbox)"
+    r"|(?P<summary>summary|everything)",
+    re.IGNORECASE,
+)
+
 
 def answer_question(report: EdulinkReport, question: str) -> str:
     """Return a conversational response based on the question."""
@@ -13,18 +23,18 @@ def answer_question(report: EdulinkReport, question: str) -> str:
     if not question:
         return "I didn't catch a question. Ask me about homework, behaviour, achievement points, or recent messages."
 
-    text = question.lower()
+    topics = {match.lastgroup for match in _TOPIC_RE.finditer(question)}
 
-    if "homework" in text or "assignment" in text or "tasks" in text:
+    if "homework" in topics:
         return _describe_homework(report.homework_outstanding)
 
-    if "behaviour" in text or "behavior" in text or "achievement" in text or "points" in text:
+    if "behaviour" in topics:
         return _describe_behaviour(report.total_achievement_points, report.behaviour_new)
 
-    if "mail" in text or "email" in text or "message" in text or "communicator" in text or "inbox" in text:
+    if "mail" in topics:
         return _describe_mail(report.mailbox_new)
 
-    if "summary" in text or "everything" in text:
+    if "summary" in topics:
         return report.summary_text
 
     return (
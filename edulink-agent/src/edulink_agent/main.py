@@ -8,8 +8,15 @@ import logging
 import sys
 from typing import Optional
 
-from .config import Settings
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
+from .browser_pool import BrowserPool
+from .config import Settings, get_settings
 from .conversation import answer_question
+from .models import EdulinkReport
 from .scraper import collect_report
 from .summariser import build_summary
 
@@ -29,9 +36,10 @@ def cli(argv: Optional[list[str]] = None) -> int:
     )
     args = parser.parse_args(argv)
 
-    settings = Settings()
+    settings = get_settings()
     try:
-        report = asyncio.run(collect_report(settings))
+        run = uvloop.run if uvloop is not None else asyncio.run
+        report = run(_collect_once(settings))
         report.summary_text = build_summary(report)
     except Exception as exc:
         logger.exception("Failed to collect Edulink report: %s", exc)
@@ -47,5 +55,12 @@ def cli(argv: Optional[list[str]] = None) -> int:
     return 0
 
 
+async def _collect_once(settings: Settings) -> EdulinkReport:
+    """Collect a single report using a one-browser pool."""
+
+    async with BrowserPool(settings, size=1) as pool:
+        return await collect_report(settings, pool)
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(cli())
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-from datetime import datetime, date
+import datetime as dt
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class HomeworkItem(BaseModel):
     """Outstanding homework entry."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     subject: Optional[str] = None
     title: Optional[str] = None
     set_by: Optional[str] = Field(default=None, alias="teacher")
-    due_date: Optional[date] = None
+    due_date: Optional[dt.date] = None
     submission_status: Optional[str] = None
     details: Optional[str] = None
 
@@ -22,7 +24,7 @@ class HomeworkItem(BaseModel):
 class BehaviourEntry(BaseModel):
     """Behaviour record (achievement/points)."""
 
-    date: Optional[date] = None
+    date: Optional[dt.date] = None
     category: Optional[str] = None
     points: Optional[int] = None
     description: Optional[str] = None
@@ -32,7 +34,7 @@ class BehaviourEntry(BaseModel):
 class MailEntry(BaseModel):
     """Communicator mailbox item."""
 
-    date: Optional[date] = None
+    date: Optional[dt.date] = None
     sender: Optional[str] = None
     subject: Optional[str] = None
     summary: Optional[str] = None
@@ -41,7 +43,7 @@ class MailEntry(BaseModel):
 class EdulinkReport(BaseModel):
     """Complete Edulink summary."""
 
-    generated_at: datetime
+    generated_at: dt.datetime
     timezone: str
     child_name: Optional[str] = None
     total_achievement_points: Optional[int] = None
@@ -50,8 +52,6 @@ class EdulinkReport(BaseModel):
     mailbox_new: List[MailEntry] = Field(default_factory=list)
     summary_text: str
 
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat(),
-            date: lambda d: d.isoformat(),
-        }
+    @field_serializer("generated_at")
+    def _serialise_generated_at(self, value: dt.datetime) -> str:
+        return value.isoformat()
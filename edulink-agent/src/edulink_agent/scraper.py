@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import os
 import re
+import sys
+import tempfile
 from contextlib import suppress
-from datetime import date
-from typing import Dict, List, Optional
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-from bs4 import BeautifulSoup, Tag
-from playwright.async_api import Browser, Page, Playwright, TimeoutError as PlaywrightTimeoutError, async_playwright
+from playwright.async_api import Browser, BrowserContext, Page, Route, TimeoutError as PlaywrightTimeoutError
 
+from .browser_pool import BrowserPool
 from .config import Settings
 from .models import BehaviourEntry, EdulinkReport, HomeworkItem, MailEntry
-from .utils import normalise_whitespace, now_in_timezone, parse_date, yesterday
+from .utils import normalise_whitespace, now_in_timezone, parse_date
 
 logger = logging.getLogger(__name__)
 
@@ -23,26 +28,97 @@ LOGIN_USERNAME_SELECTOR = "input[name='username'], input#username, input[placeho
 LOGIN_PASSWORD_SELECTOR = "input[type='password'], input#password"
 LOGIN_SUBMIT_SELECTOR = "button[type='submit'], button:has-text('Log in'), button:has-text('Login')"
 SCHOOL_INPUT_SELECTOR = "input[name='institution'], input#institution, input[placeholder*='school' i]"
-
-
-async def collect_report(settings: Settings) -> EdulinkReport:
+AUTHENTICATED_SELECTOR = "nav, a[href*='homework'], .menu"
+
+# The scraper only reads text, so skip downloading assets and tracking beacons.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_URL_FRAGMENTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar")
+
+TOTAL_POINTS_RE = re.compile(r"(?:total\s+)?achievement\s+points\D*(\d+)", re.IGNORECASE)
+
+# Run in the page so only the cell text of the matching table crosses the Playwright bridge.
+EXTRACT_TABLE_JS = """
+(required) => {
+  const clean = (node) => (node.textContent || "").replace(/\\s+/g, " ").trim();
+  for (const table of document.querySelectorAll("table")) {
+    let headerCells = table.querySelectorAll("thead th");
+    if (!headerCells.length) headerCells = table.querySelectorAll("tr th");
+    const headers = Array.from(headerCells, clean);
+    const names = new Set(headers.map((header) => header.toLowerCase()));
+    if (required.every((name) => names.has(name))) {
+      return {
+        headers,
+        rows: Array.from(table.querySelectorAll("tbody tr"), (row) => Array.from(row.querySelectorAll("td"), clean)),
+      };
+    }
+  }
+  return null;
+}
+"""
+ACHIEVEMENT_TEXT_JS = """
+() => ({
+  text: document.body ? document.body.innerText : "",
+  labels: Array.from(
+    document.querySelectorAll("span[class*='green' i], div[class*='green' i]"),
+    (node) => (node.textContent || "").trim(),
+  ),
+})
+"""
+
+
+def _intern_aliases(groups: Dict[str, tuple[str, ...]]) -> Dict[str, tuple[str, ...]]:
+    """Lower-case and intern alias strings so header comparisons hit the identity fast path."""
+
+    return {key: tuple(sys.intern(alias.lower()) for alias in aliases) for key, aliases in groups.items()}
+
+
+# Header aliases per report field, tried in order when resolving a table's columns.
+HOMEWORK_COLUMNS: Dict[str, tuple[str, ...]] = _intern_aliases({
+    "submission": ("submission",),
+    "subject": ("subject", "class"),
+    "title": ("title", "description", "homework"),
+    "set_by": ("teacher", "staff", "set by"),
+    "due": ("due", "deadline"),
+    "details": ("details", "notes"),
+})
+BEHAVIOUR_COLUMNS: Dict[str, tuple[str, ...]] = _intern_aliases({
+    "date": ("date",),
+    "points": ("points", "score"),
+    "category": ("type", "category"),
+    "description": ("description", "reason", "details"),
+    "staff": ("staff", "teacher"),
+})
+MAIL_COLUMNS: Dict[str, tuple[str, ...]] = _intern_aliases({
+    "date": ("date", "received"),
+    "sender": ("from", "sender"),
+    "subject": ("subject", "title"),
+    "summary": ("summary", "message", "content"),
+})
+
+
+async def collect_report(settings: Settings, pool: BrowserPool) -> EdulinkReport:
     """Main entry point that orchestrates the scraping workflow."""
 
     tz_name = settings.timezone
     generated_at = now_in_timezone(tz_name)
-    target_date = yesterday(tz_name)
+    target_date = (generated_at - timedelta(days=1)).date()
+
+    async with pool.acquire() as browser:
+        storage_state = await _authenticated_state(browser, settings)
 
-    async with async_playwright() as playwright:
-        browser = await _launch_browser(playwright, settings.headless)
+        # Each section gets its own authenticated context so the three pages load concurrently.
+        contexts: List[BrowserContext] = []
         try:
-            context = await browser.new_context()
-            page = await context.new_page()
-            await _login(page, settings)
-            homework = await _collect_homework(page, settings)
-            total_points, behaviour_entries = await _collect_behaviour(page, settings, target_date)
-            mailbox_entries = await _collect_mail(page, settings, target_date)
+            for _ in range(3):
+                contexts.append(await _new_context(browser, storage_state=storage_state))
+            homework_page, behaviour_page, mail_page = [await context.new_page() for context in contexts]
+            homework, (total_points, behaviour_entries), mailbox_entries = await asyncio.gather(
+                _collect_homework(homework_page, settings),
+                _collect_behaviour(behaviour_page, settings, target_date),
+                _collect_mail(mail_page, settings, target_date),
+            )
         finally:
-            await browser.close()
+            await asyncio.gather(*(context.close() for context in contexts), return_exceptions=True)
 
     return EdulinkReport(
         generated_at=generated_at,
@@ -56,37 +132,116 @@ async def collect_report(settings: Settings) -> EdulinkReport:
     )
 
 
-async def _launch_browser(playwright: Playwright, headless: bool) -> Browser:
-    """Launch Chromium with sensible defaults."""
-    logger.info("Launching Chromium headless=%s", headless)
-    return await playwright.chromium.launch(
-        headless=headless,
-        args=[
-            "--disable-dev-shm-usage",
-            "--no-sandbox",
-        ],
-    )
+async def _new_context(browser: Browser, **kwargs: Any) -> BrowserContext:
+    """Create a browser context that drops assets the scraper never reads."""
+
+    context = await browser.new_context(service_workers="block", **kwargs)
+    await context.route("**/*", _filter_request)
+    return context
+
+
+async def _filter_request(route: Route) -> None:
+    """Abort images, fonts, media and analytics requests; let everything else through."""
+
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _authenticated_state(browser: Browser, settings: Settings) -> Dict[str, Any]:
+    """Return a logged-in storage state, reusing the persisted session while it is still valid."""
+
+    state_path = settings.storage_state_path
+    stored = _load_storage_state(state_path) if state_path else None
+    if stored is not None:
+        context = await _new_context(browser, storage_state=stored)
+        try:
+            if await _session_is_valid(await context.new_page(), settings):
+                logger.info("Reusing stored Edulink session from %s", state_path)
+                return await context.storage_state()
+        finally:
+            await context.close()
+        logger.info("Stored Edulink session has expired; logging in again")
+
+    context = await _new_context(browser)
+    try:
+        await _login(await context.new_page(), settings)
+        state = await context.storage_state()
+    finally:
+        await context.close()
+    if state_path:
+        _save_storage_state(state_path, state)
+    return state
+
+
+def _load_storage_state(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a persisted session, treating a missing or unreadable file as no session."""
+
+    try:
+        with path.open(encoding="utf-8") as handle:
+            state = json.load(handle)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable Edulink session file %s: %s", path, exc)
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _save_storage_state(path: Path, state: Dict[str, Any]) -> None:
+    """Atomically persist the session cookies, readable only by the current user."""
+
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file with 0600 permissions.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(state, handle)
+        os.replace(tmp_name, path)
+    except OSError as exc:
+        logger.warning("Failed to persist Edulink session to %s: %s", path, exc)
+
+
+async def _session_is_valid(page: Page, settings: Settings) -> bool:
+    """Probe the homework page and report whether Edulink kept us signed in.
+
+    Only the homework table counts as proof: generic chrome such as ``nav`` can render on the
+    login page, or before the SPA redirects an expired session there.
+    """
+
+    await page.goto(f"{settings.base_url}/#!/homework/list", wait_until="domcontentloaded")
+    try:
+        await page.wait_for_function(
+            EXTRACT_TABLE_JS, arg=["submission"], timeout=settings.timeout_seconds * 1000
+        )
+    except PlaywrightTimeoutError:
+        return False
+    return "/login" not in page.url
 
 
 async def _login(page: Page, settings: Settings) -> None:
     """Handle the Edulink login workflow."""
 
-    logger.info("Navigating to login page")
+    logger.debug("Navigating to login page")
     await page.goto(f"{settings.base_url}/#!/login", wait_until="domcontentloaded")
 
     if settings.school_code:
-        logger.info("Filling school code")
+        logger.debug("Filling school code")
         with suppress(PlaywrightTimeoutError):
             school_input = await page.wait_for_selector(SCHOOL_INPUT_SELECTOR, timeout=settings.timeout_seconds * 1000)
             await school_input.fill(settings.school_code)
-            await asyncio.sleep(0.5)
             with suppress(PlaywrightTimeoutError):
                 await page.click("button:has-text('Next')")
-                await page.wait_for_timeout(500)
 
     logger.info("Submitting credentials for %s", settings.username)
     try:
-        username_input = await page.wait_for_selector(LOGIN_USERNAME_SELECTOR, timeout=settings.timeout_seconds * 1000)
+        username_input = await page.wait_for_selector(
+            LOGIN_USERNAME_SELECTOR, state="visible", timeout=settings.timeout_seconds * 1000
+        )
         password_input = await page.wait_for_selector(LOGIN_PASSWORD_SELECTOR, timeout=settings.timeout_seconds * 1000)
     except PlaywrightTimeoutError as exc:
         raise RuntimeError("Unable to locate login form elements on Edulink") from exc
@@ -94,46 +249,46 @@ async def _login(page: Page, settings: Settings) -> None:
     await username_input.fill(settings.username)
     await password_input.fill(settings.password.get_secret_value())
     await page.click(LOGIN_SUBMIT_SELECTOR)
-    await page.wait_for_timeout(2000)
+    try:
+        await page.wait_for_url(lambda url: "/login" not in url, timeout=settings.timeout_seconds * 1000)
+    except PlaywrightTimeoutError as exc:
+        raise RuntimeError("Edulink login did not complete; still on the login page") from exc
 
     # Verify login by checking for a navigation item visible after authentication.
     with suppress(PlaywrightTimeoutError):
-        await page.wait_for_selector("nav, a[href*='homework'], .menu", timeout=settings.timeout_seconds * 1000)
+        await page.wait_for_selector(AUTHENTICATED_SELECTOR, timeout=settings.timeout_seconds * 1000)
 
 
 async def _collect_homework(page: Page, settings: Settings) -> List[HomeworkItem]:
     """Return outstanding homework items."""
 
     url = f"{settings.base_url}/#!/homework/list"
-    logger.info("Fetching homework list %s", url)
+    logger.debug("Fetching homework list %s", url)
     await page.goto(url, wait_until="domcontentloaded")
     await _stabilise(page)
 
-    html = await page.content()
-    soup = BeautifulSoup(html, "html.parser")
-    table = _find_table_with_header(soup, required=("submission",))
+    table = await _extract_table(page, required=("submission",))
 
-    if not table:
+    if table is None:
         logger.warning("Homework table not found; returning empty list")
         return []
 
-    header_map = _map_table_headers(table)
+    columns = _build_alias_index(_map_table_headers(table["headers"]), HOMEWORK_COLUMNS)
     items: List[HomeworkItem] = []
 
-    for row in table.select("tbody tr"):
-        cells = row.find_all("td")
-        if not cells:
+    for values in table["rows"]:
+        if not values:
             continue
-        values = [normalise_whitespace(cell.get_text()) for cell in cells]
-        submission = _value_for_header(values, header_map, ("submission",))
+        submission = _first_value(values, columns["submission"])
         if submission and "not" in submission.lower():
-            item = HomeworkItem(
-                subject=_value_for_header(values, header_map, ("subject", "class")),
-                title=_value_for_header(values, header_map, ("title", "description", "homework")),
-                set_by=_value_for_header(values, header_map, ("teacher", "staff", "set by")),
-                due_date=parse_date(_value_for_header(values, header_map, ("due", "deadline")) or ""),
+            # Cells are already cleaned strings/dates, so skip pydantic validation for each row.
+            item = HomeworkItem.model_construct(
+                subject=_first_value(values, columns["subject"]),
+                title=_first_value(values, columns["title"]),
+                set_by=_first_value(values, columns["set_by"]),
+                due_date=parse_date(_first_value(values, columns["due"]) or ""),
                 submission_status=submission,
-                details=_value_for_header(values, header_map, ("details", "notes")),
+                details=_first_value(values, columns["details"]),
             )
             items.append(item)
 
@@ -145,43 +300,43 @@ async def _collect_behaviour(page: Page, settings: Settings, target_date: date)
     """Return behaviour summary (total points + entries for the specified date)."""
 
     url = f"{settings.base_url}/#!/behaviour/summary/points/achievement"
-    logger.info("Fetching behaviour summary %s", url)
+    logger.debug("Fetching behaviour summary %s", url)
     await page.goto(url, wait_until="domcontentloaded")
     await _stabilise(page)
 
-    html = await page.content()
-    soup = BeautifulSoup(html, "html.parser")
-
-    total_points = _extract_total_achievement_points(soup)
+    total_points = _extract_total_achievement_points(await page.evaluate(ACHIEVEMENT_TEXT_JS))
 
-    table = _find_table_with_header(soup, required=("date", "points"))
-    if not table:
+    table = await _extract_table(page, required=("date", "points"))
+    if table is None:
         logger.warning("Behaviour entries table not found")
         return total_points, []
 
-    header_map = _map_table_headers(table)
+    columns = _build_alias_index(_map_table_headers(table["headers"]), BEHAVIOUR_COLUMNS)
     entries: List[BehaviourEntry] = []
+    day_marker = str(target_date.day)
 
-    for row in table.select("tbody tr"):
-        cells = row.find_all("td")
-        if not cells:
+    for values in table["rows"]:
+        if not values:
+            continue
+        date_text = _first_value(values, columns["date"])
+        # Rows that can't mention the target day are skipped before the costly date parse.
+        if not date_text or day_marker not in date_text:
             continue
-        values = [normalise_whitespace(cell.get_text()) for cell in cells]
-        entry_date = parse_date(_value_for_header(values, header_map, ("date",)))
+        entry_date = parse_date(date_text)
         if entry_date != target_date:
             continue
-        points_text = _value_for_header(values, header_map, ("points", "score"))
+        points_text = _first_value(values, columns["points"])
         try:
             points = int(points_text) if points_text is not None else None
         except ValueError:
             points = None
 
-        entry = BehaviourEntry(
+        entry = BehaviourEntry.model_construct(
             date=entry_date,
-            category=_value_for_header(values, header_map, ("type", "category")),
+            category=_first_value(values, columns["category"]),
             points=points,
-            description=_value_for_header(values, header_map, ("description", "reason", "details")),
-            staff=_value_for_header(values, header_map, ("staff", "teacher")),
+            description=_first_value(values, columns["description"]),
+            staff=_first_value(values, columns["staff"]),
         )
         entries.append(entry)
 
@@ -193,39 +348,39 @@ async def _collect_mail(page: Page, settings: Settings, target_date: date) -> Li
     """Return communicator mailbox entries for the specified date."""
 
     url = f"{settings.base_url}/#!/communicator/mailbox"
-    logger.info("Fetching communicator mailbox %s", url)
+    logger.debug("Fetching communicator mailbox %s", url)
     await page.goto(url, wait_until="domcontentloaded")
 
     # Ensure the "Received" tab is active.
     with suppress(Exception):
         await page.click("button:has-text('Received'), a:has-text('Received')")
-        await page.wait_for_timeout(500)
 
     await _stabilise(page)
 
-    html = await page.content()
-    soup = BeautifulSoup(html, "html.parser")
-    table = _find_table_with_header(soup, required=("date", "subject"))
-    if not table:
+    table = await _extract_table(page, required=("date", "subject"))
+    if table is None:
         logger.warning("Mailbox table not found")
         return []
 
-    header_map = _map_table_headers(table)
+    columns = _build_alias_index(_map_table_headers(table["headers"]), MAIL_COLUMNS)
     entries: List[MailEntry] = []
+    day_marker = str(target_date.day)
 
-    for row in table.select("tbody tr"):
-        cells = row.find_all("td")
-        if not cells:
+    for values in table["rows"]:
+        if not values:
             continue
-        values = [normalise_whitespace(cell.get_text()) for cell in cells]
-        entry_date = parse_date(_value_for_header(values, header_map, ("date", "received")))
+        date_text = _first_value(values, columns["date"])
+        # Rows that can't mention the target day are skipped before the costly date parse.
+        if not date_text or day_marker not in date_text:
+            continue
+        entry_date = parse_date(date_text)
         if entry_date != target_date:
             continue
-        entry = MailEntry(
+        entry = MailEntry.model_construct(
             date=entry_date,
-            sender=_value_for_header(values, header_map, ("from", "sender")),
-            subject=_value_for_header(values, header_map, ("subject", "title")),
-            summary=_value_for_header(values, header_map, ("summary", "message", "content")),
+            sender=_first_value(values, columns["sender"]),
+            subject=_first_value(values, columns["subject"]),
+            summary=_first_value(values, columns["summary"]),
         )
         entries.append(entry)
 
@@ -234,68 +389,73 @@ async def _collect_mail(page: Page, settings: Settings, target_date: date) -> Li
 
 
 async def _stabilise(page: Page) -> None:
-    """Wait for network traffic to idle, ignoring timeouts."""
+    """Wait for network traffic to idle and a table to render, ignoring timeouts."""
 
     with suppress(Exception):
         await page.wait_for_load_state("networkidle", timeout=4000)
-    await page.wait_for_timeout(500)
+    with suppress(PlaywrightTimeoutError):
+        await page.wait_for_selector("table", timeout=2000)
 
 
-def _find_table_with_header(soup: BeautifulSoup, required: tuple[str, ...]) -> Optional[Tag]:
-    """Return the first table that contains all required headers."""
+async def _extract_table(page: Page, required: tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """Return headers and row cell text of the first table that contains all required headers."""
 
-    required_normalised = {h.lower() for h in required}
-    for table in soup.find_all("table"):
-        header_map = _map_table_headers(table)
-        if required_normalised.issubset(set(header_map.keys())):
-            return table
-    return None
+    return await page.evaluate(EXTRACT_TABLE_JS, [h.lower() for h in required])
 
 
-def _map_table_headers(table: Tag) -> Dict[str, int]:
+def _map_table_headers(headers: List[str]) -> Dict[str, int]:
     """Map normalised header names to their column index."""
 
     mapping: Dict[str, int] = {}
-    headers = table.select("thead th")
-    if not headers:
-        headers = table.select("tr th")
-
     for idx, header in enumerate(headers):
-        text = normalise_whitespace(header.get_text()).lower()
+        text = normalise_whitespace(header).lower()
         if not text:
             continue
-        mapping[text] = idx
+        mapping[sys.intern(text)] = idx
     return mapping
 
 
-def _value_for_header(values: List[str], header_map: Dict[str, int], aliases: tuple[str, ...]) -> Optional[str]:
-    """Return the first matching value for the provided header aliases."""
+def _build_alias_index(header_map: Dict[str, int], groups: Dict[str, tuple[str, ...]]) -> Dict[str, tuple[int, ...]]:
+    """Resolve each alias group to the column indices it matches, in lookup order."""
+
+    index: Dict[str, tuple[int, ...]] = {}
+    for key, aliases in groups.items():
+        columns: List[int] = []
+        for alias in aliases:
+            exact = header_map.get(alias)
+            if exact is not None and exact not in columns:
+                columns.append(exact)
+            for header, idx in header_map.items():
+                if idx not in columns and alias in header:
+                    columns.append(idx)
+        index[key] = tuple(columns)
+    return index
+
+
+def _first_value(values: List[str], columns: tuple[int, ...]) -> Optional[str]:
+    """Return the first non-empty cell among the resolved columns."""
 
-    for alias in aliases:
-        alias_lower = alias.lower()
-        for header, idx in header_map.items():
-            if alias_lower == header or alias_lower in header:
-                if 0 <= idx < len(values):
-                    value = values[idx].strip()
-                    if value:
-                        return value
+    for idx in columns:
+        if idx < len(values):
+            value = values[idx].strip()
+            if value:
+                return value
     return None
 
 
-def _extract_total_achievement_points(soup: BeautifulSoup) -> Optional[int]:
-    """Extract the achievement points total from the behaviour page."""
+def _extract_total_achievement_points(page_text: Dict[str, Any]) -> Optional[int]:
+    """Extract the achievement points total from the behaviour page text."""
 
     # Look for obvious numeric summaries.
-    text = soup.get_text(" ", strip=True)
-    match = re.search(r"(total\s+achievement\s+points|achievement\s+points)\D*(\d+)", text, flags=re.IGNORECASE)
+    match = TOTAL_POINTS_RE.search(page_text["text"])
     if match:
         try:
-            return int(match.group(2))
+            return int(match.group(1))
         except ValueError:
             pass
 
     # As a fallback, search for green labels.
-    for element in soup.find_all(["span", "div"], attrs={"class": re.compile("green", re.IGNORECASE)}):
+    for label in page_text["labels"]:
         with suppress(ValueError):
-            return int(element.get_text(strip=True))
+            return int(label)
     return None
@@ -2,69 +2,79 @@
 
 from __future__ import annotations
 
-from datetime import date
-from typing import List
+import io
 
-from .models import BehaviourEntry, EdulinkReport, HomeworkItem, MailEntry
+from .models import EdulinkReport
 from .utils import normalise_whitespace
 
+HOMEWORK_HEADING = "📚 Outstanding homework:\n"
+NO_HOMEWORK = "📚 No outstanding homework today.\n"
+BEHAVIOUR_HEADING = "   New entries from yesterday:\n"
+NO_BEHAVIOUR = "   No new behaviour entries yesterday.\n"
+MAIL_HEADING = "📬 New communicator messages (yesterday):\n"
+NO_MAIL = "📬 No new communicator messages yesterday.\n"
+SIGN_OFF = "Have a great day!"
+
 
 def build_summary(report: EdulinkReport) -> str:
     """Return a human-friendly message summarising the report."""
 
-    lines: List[str] = []
+    homework = report.homework_outstanding
+    behaviour = report.behaviour_new
+    mailbox = report.mailbox_new
+    points = report.total_achievement_points
+
+    buf = io.StringIO()
+    w = buf.write
+
     heading_name = f" for {report.child_name}" if report.child_name else ""
-    lines.append(f"Edulink daily summary{heading_name} — {report.generated_at.strftime('%A %d %B %Y')}")
-    lines.append("")
+    w(f"Edulink daily summary{heading_name} — {report.generated_at.strftime('%A %d %B %Y')}\n\n")
 
     # Homework
-    if report.homework_outstanding:
-        lines.append("📚 Outstanding homework:")
-        for item in report.homework_outstanding:
+    if homework:
+        w(HOMEWORK_HEADING)
+        for item in homework:
             subject = _fallback(item.subject, "Subject unknown")
             title = _fallback(item.title, "Untitled task")
-            due = item.due_date.strftime("%d %b %Y") if item.due_date else "No due date"
+            due_date = item.due_date
+            due = due_date.strftime("%d %b %Y") if due_date else "No due date"
             teacher = f" — {item.set_by}" if item.set_by else ""
-            lines.append(f" • {subject}: {title}{teacher} (due {due})")
+            w(f" • {subject}: {title}{teacher} (due {due})\n")
     else:
-        lines.append("📚 No outstanding homework today.")
-    lines.append("")
+        w(NO_HOMEWORK)
+    w("\n")
 
     # Behaviour
-    if report.total_achievement_points is not None:
-        lines.append(f"⭐ Achievement points: {report.total_achievement_points}")
-    else:
-        lines.append("⭐ Achievement points: unavailable")
-
-    if report.behaviour_new:
-        lines.append("   New entries from yesterday:")
-        for entry in report.behaviour_new:
+    w(f"⭐ Achievement points: {points if points is not None else 'unavailable'}\n")
+    if behaviour:
+        w(BEHAVIOUR_HEADING)
+        for entry in behaviour:
             cat = _fallback(entry.category, "General")
             pts = f"{entry.points:+d}" if entry.points is not None else "N/A"
             desc = _fallback(entry.description, "No description provided")
             staff = f" ({entry.staff})" if entry.staff else ""
-            lines.append(f"   • {cat}: {desc}{staff} — {pts} points")
+            w(f"   • {cat}: {desc}{staff} — {pts} points\n")
     else:
-        lines.append("   No new behaviour entries yesterday.")
-    lines.append("")
+        w(NO_BEHAVIOUR)
+    w("\n")
 
     # Mailbox
-    if report.mailbox_new:
-        lines.append("📬 New communicator messages (yesterday):")
-        for mail in report.mailbox_new:
+    if mailbox:
+        w(MAIL_HEADING)
+        for mail in mailbox:
             sender = _fallback(mail.sender, "Unknown sender")
             subject = _fallback(mail.subject, "No subject")
             summary = _fallback(mail.summary, "")
             summary_suffix = f" – {summary}" if summary else ""
-            lines.append(f" • {sender}: {subject}{summary_suffix}")
+            w(f" • {sender}: {subject}{summary_suffix}\n")
     else:
-        lines.append("📬 No new communicator messages yesterday.")
+        w(NO_MAIL)
 
-    lines.append("")
-    lines.append("Have a great day!")
-    return "\n".join(lines)
+    w("\n")
+    w(SIGN_OFF)
+    return buf.getvalue()
 
 
 def _fallback(value: str | None, default: str) -> str:
-    candidate = normalise_whitespace(value or "")
+    candidate = normalise_whitespace(value)
     return candidate if candidate else default
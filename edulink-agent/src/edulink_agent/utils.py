@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-import re
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Iterable, Optional
 
 from dateutil import parser as date_parser
@@ -12,7 +12,11 @@ from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+# Common Edulink date layouts, tried with strptime before falling back to dateutil.
+_FAST_FORMATS = ("%d/%m/%Y", "%Y-%m-%d", "%d %b %Y", "%d %B %Y")
 
+
+@lru_cache(maxsize=8)
 def get_zone(timezone_name: str) -> ZoneInfo:
     """Return a ZoneInfo instance, defaulting to UTC on failure."""
     try:
@@ -28,11 +32,6 @@ def now_in_timezone(timezone_name: str) -> datetime:
     return datetime.now(tz=zone)
 
 
-def yesterday(timezone_name: str) -> date:
-    """Date for 'yesterday' in the configured timezone."""
-    return (now_in_timezone(timezone_name) - timedelta(days=1)).date()
-
-
 def parse_date(text: str) -> Optional[date]:
     """Best-effort parsing of a human-readable date string."""
     if not text:
@@ -41,6 +40,12 @@ def parse_date(text: str) -> Optional[date]:
     if not cleaned:
         return None
 
+    for fmt in _FAST_FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt).date()
+        except ValueError:
+            continue
+
     try:
         dt = date_parser.parse(cleaned, dayfirst=True, fuzzy=True)
     except (ValueError, OverflowError) as exc:
@@ -49,9 +54,9 @@ def parse_date(text: str) -> Optional[date]:
     return dt.date()
 
 
-def normalise_whitespace(text: str) -> str:
+def normalise_whitespace(text: str | None = "") -> str:
     """Collapse repeated whitespace into single spaces."""
-    return re.sub(r"\s+", " ", text or "").strip()
+    return " ".join(text.split()) if text else ""
 
 
 def first_non_empty(values: Iterable[str | None]) -> Optional[str]:
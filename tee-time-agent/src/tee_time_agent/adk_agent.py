@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import AsyncGenerator, List
+from typing import AsyncGenerator, List, Optional
 
 import structlog
 from google.adk.agents.base_agent import BaseAgent
@@ -15,12 +16,12 @@ from .config import Settings
 from .date_window import TargetDate
 from .ollama_client import OllamaClient
 from .playwright_client import TeeSheetBrowser, TeeSheetSnapshot
-from .telegram import format_message, post_to_telegram
+from .telegram import format_message, group_sections, join_sections, post_to_telegram
 
 LOGGER = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SnapshotRecord:
     """Container linking a target date to its captured tee sheet snapshot."""
 
@@ -55,28 +56,23 @@ class TeeTimeAgent(BaseAgent):
 
         try:
             async with TeeSheetBrowser(self.settings) as browser:
-                for target in self.targets:
-                    url = self.settings.tee_sheet_url(target.value)
-                    try:
-                        snapshot = await browser.snapshot_for_date(
-                            date_iso=target.iso,
-                            day_name=target.day_name,
-                            url=url,
-                        )
-                        snapshots.append(SnapshotRecord(target=target, snapshot=snapshot))
+                async for target, record, error in self._snapshot_all(browser):
+                    if record is not None:
+                        snapshots.append(record)
                         yield self._text_event(
                             ctx,
                             f"Fetched tee sheet for {target.day_name} {target.iso}.",
                         )
-                    except Exception as exc:  # noqa: BLE001
-                        LOGGER.exception(
+                    else:
+                        LOGGER.error(
                             "agent.fetch_failed",
                             target_date=target.iso,
-                            error=str(exc),
+                            error=str(error),
+                            exc_info=error,
                         )
                         yield self._text_event(
                             ctx,
-                            f"Failed to fetch tee sheet for {target.day_name} {target.iso}: {exc}",
+                            f"Failed to fetch tee sheet for {target.day_name} {target.iso}: {error}",
                         )
         except Exception as exc:  # noqa: BLE001
             LOGGER.exception("agent.browser_error", error=str(exc))
@@ -95,51 +91,73 @@ class TeeTimeAgent(BaseAgent):
             )
             return
 
+        # Snapshots arrive in completion order; the combined message reads best in date order.
+        snapshots.sort(key=lambda record: record.target.value)
         delivered: list[str] = []
         failures: list[str] = []
 
-        for record in snapshots:
-            target = record.target
-            snapshot = record.snapshot
-            try:
-                analysis = await self._ollama.analyse_snapshot(snapshot)
-                yield self._text_event(
-                    ctx,
-                    f"Analysed tee sheet for {target.day_name} {target.iso}: {analysis.summary}",
-                )
-            except Exception as exc:  # noqa: BLE001
-                LOGGER.exception(
-                    "agent.ollama_failed",
-                    target_date=target.iso,
-                    error=str(exc),
-                )
-                failures.append(f"Ollama analysis failed for {target.iso}: {exc}")
-                yield self._text_event(
-                    ctx,
-                    f"Ollama analysis failed for {target.day_name} {target.iso}: {exc}",
-                )
-                continue
-
-            message = format_message(analysis)
+        # Stream progress from the model as events while the analysis runs.
+        progress: asyncio.Queue[int] = asyncio.Queue()
+        analysis_task = asyncio.create_task(
+            self._ollama.analyse_snapshots(
+                [record.snapshot for record in snapshots],
+                on_progress=progress.put_nowait,
+            )
+        )
+        try:
+            while not analysis_task.done():
+                waiter = asyncio.ensure_future(progress.get())
+                try:
+                    await asyncio.wait({analysis_task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    waiter.cancel()
+                if waiter.done() and not waiter.cancelled():
+                    yield self._text_event(
+                        ctx,
+                        f"Ollama analysis in progress — {waiter.result()} characters generated.",
+                    )
+            analyses = analysis_task.result()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.exception(
+                "agent.ollama_failed",
+                target_dates=[record.target.iso for record in snapshots],
+                error=str(exc),
+            )
+            analyses = []
+            for record in snapshots:
+                target = record.target
+                failures.append(f"Ollama analysis failed for {target.day_name} {target.iso}: {exc}")
+                yield self._text_event(ctx, failures[-1])
+        finally:
+            analysis_task.cancel()
+            await self._ollama.aclose()
+
+        for record, analysis in zip(snapshots, analyses):
+            yield self._text_event(
+                ctx,
+                f"Analysed tee sheet for {record.target.day_name} {record.target.iso}: {analysis.summary}",
+            )
 
+        # One Telegram message per run, split only where the combined text exceeds the size cap.
+        sections = [format_message(analysis) for analysis in analyses]
+        for group in group_sections(sections):
+            targets = [snapshots[index].target for index in group]
+            labels = ", ".join(f"{target.day_name} {target.iso}" for target in targets)
             try:
-                await post_to_telegram(self.settings, message)
-                delivered.append(target.iso)
-                yield self._text_event(
-                    ctx,
-                    f"Telegram update sent for {target.day_name} {target.iso}.",
-                )
+                await post_to_telegram(self.settings, join_sections(sections[index] for index in group))
             except Exception as exc:  # noqa: BLE001
                 LOGGER.exception(
                     "agent.telegram_failed",
-                    target_date=target.iso,
+                    target_dates=[target.iso for target in targets],
                     error=str(exc),
                 )
-                failures.append(f"Telegram send failed for {target.iso}: {exc}")
-                yield self._text_event(
-                    ctx,
-                    f"Telegram send failed for {target.day_name} {target.iso}: {exc}",
+                failures.extend(
+                    f"Telegram send failed for {target.day_name} {target.iso}: {exc}" for target in targets
                 )
+                yield self._text_event(ctx, f"Telegram send failed for {labels}: {exc}")
+            else:
+                delivered.extend(target.iso for target in targets)
+                yield self._text_event(ctx, f"Telegram update sent for {labels}.")
 
         summary_lines = [
             f"Delivery summary — succeeded: {len(delivered)}, failed: {len(failures)}."
@@ -152,6 +170,34 @@ class TeeTimeAgent(BaseAgent):
 
         yield self._text_event(ctx, "\n".join(summary_lines), final=True)
 
+    async def _snapshot_all(
+        self, browser: TeeSheetBrowser
+    ) -> AsyncGenerator[tuple[TargetDate, Optional[SnapshotRecord], Optional[Exception]], None]:
+        """Capture every target concurrently, yielding outcomes in completion order."""
+        semaphore = asyncio.Semaphore(max(1, self.settings.max_parallel_pages))
+
+        async def capture(
+            target: TargetDate,
+        ) -> tuple[TargetDate, Optional[SnapshotRecord], Optional[Exception]]:
+            try:
+                async with semaphore:
+                    page = await browser.new_page()
+                    try:
+                        snapshot = await browser.snapshot_for_date(
+                            page,
+                            date_iso=target.iso,
+                            day_name=target.day_name,
+                            url=self.settings.tee_sheet_url(target.value),
+                        )
+                    finally:
+                        await page.context.close()
+            except Exception as exc:  # noqa: BLE001
+                return target, None, exc
+            return target, SnapshotRecord(target=target, snapshot=snapshot), None
+
+        for outcome in asyncio.as_completed([capture(target) for target in self.targets]):
+            yield await outcome
+
     def _text_event(self, ctx, text: str, *, final: bool = False) -> Event:
         """Create a simple text event for the ADK runner."""
         content = types.Content(
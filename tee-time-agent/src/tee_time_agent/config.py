@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import cached_property
+from pathlib import Path
 from typing import Optional
 
-from pydantic import Field, HttpUrl, SecretStr, field_validator
+from pydantic import Field, HttpUrl, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,10 +22,16 @@ class Settings(BaseSettings):
     login_url: Optional[HttpUrl] = Field(None, alias="LOGIN_URL")
     headless: bool = Field(True, alias="HEADLESS")
     timeout_seconds: int = Field(45, alias="TIMEOUT_SECONDS")
+    max_parallel_pages: int = Field(3, alias="MAX_PARALLEL_PAGES")
+    prompt_html_chars: int = Field(30_000, alias="PROMPT_HTML_CHARS")
+    prompt_text_chars: int = Field(20_000, alias="PROMPT_TEXT_CHARS")
+    data_dir: Path = Field(Path("/var/lib/tee-agent"), alias="DATA_DIR")
+    storage_state_path: Optional[Path] = Field(None, alias="STORAGE_STATE_PATH")
     telegram_bot_token: SecretStr = Field(..., alias="TELEGRAM_BOT_TOKEN")
     telegram_chat_id: str = Field(..., alias="TELEGRAM_CHAT_ID")
     ollama_base_url: HttpUrl = Field("http://ollama.ollama.svc.cluster.local:11434", alias="OLLAMA_BASE_URL")
     ollama_model: str = Field("gemma3:12b", alias="OLLAMA_MODEL")
+    cache_dir: Optional[Path] = Field(None, alias="CACHE_DIR")
     environment: str = Field("production", alias="ENVIRONMENT")
 
     model_config = SettingsConfigDict(
@@ -46,15 +54,35 @@ class Settings(BaseSettings):
             raise ValueError("club_slug must be provided when login_url is not set")
         return f"{base_url}/{club_slug}/login"
 
+    @model_validator(mode="after")
+    def default_data_paths(self) -> "Settings":
+        """Place state files under ``data_dir`` unless given explicitly."""
+        if self.storage_state_path is None:
+            self.storage_state_path = self.data_dir / "brs_state.json"
+        if self.cache_dir is None:
+            self.cache_dir = self.data_dir / "cache"
+        return self
+
+    @cached_property
+    def _base_prefix(self) -> str:
+        """Base URL without a trailing slash, computed once."""
+        return str(self.base_url).rstrip("/")
+
+    @cached_property
+    def _tee_prefix(self) -> str:
+        """Tee sheet URL up to the date segment, computed once."""
+        return f"{self._base_prefix}/{self.club_slug}/tee-sheet/{self.course_id}/"
+
     def tee_sheet_url(self, target_date: date) -> str:
         """Construct the tee sheet URL for a specific date."""
-        return (
-            f"{str(self.base_url).rstrip('/')}/"
-            f"{self.club_slug}/tee-sheet/{self.course_id}/"
-            f"{target_date:%Y/%m/%d}"
-        )
+        return f"{self._tee_prefix}{target_date:%Y/%m/%d}"
 
-    @property
+    @cached_property
     def telegram_api_endpoint(self) -> str:
         """Base Telegram Bot API endpoint."""
         return f"https://api.telegram.org/bot{self.telegram_bot_token.get_secret_value()}"
+
+    @cached_property
+    def telegram_send_message_url(self) -> str:
+        """Telegram ``sendMessage`` endpoint, computed once."""
+        return f"{self.telegram_api_endpoint}/sendMessage"
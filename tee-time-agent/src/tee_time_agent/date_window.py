@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Iterable, List
 
@@ -19,27 +19,26 @@ WEEKDAY_NAMES = {
 WEEKEND_INDICES = {4, 5, 6}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TargetDate:
-    """Represents a calendar date the agent should inspect."""
+    """Represents a calendar date the agent should inspect.
 
-    value: date
-
-    @property
-    def iso(self) -> str:
-        return self.value.isoformat()
-
-    @property
-    def verbose(self) -> str:
-        return self.value.strftime("%A %d %B %Y")
-
-    @property
-    def day_name(self) -> str:
-        return WEEKDAY_NAMES[self.value.weekday()]
+    The derived labels are computed once in ``__post_init__``; they are read repeatedly
+    while the snapshot, analysis and messaging steps run.
+    """
 
-    @property
-    def is_weekend(self) -> bool:
-        return self.value.weekday() in WEEKEND_INDICES
+    value: date
+    iso: str = field(init=False, repr=False, compare=False)
+    verbose: str = field(init=False, repr=False, compare=False)
+    day_name: str = field(init=False, repr=False, compare=False)
+    is_weekend: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        weekday = self.value.weekday()
+        object.__setattr__(self, "iso", self.value.isoformat())
+        object.__setattr__(self, "verbose", self.value.strftime("%A %d %B %Y"))
+        object.__setattr__(self, "day_name", WEEKDAY_NAMES[weekday])
+        object.__setattr__(self, "is_weekend", weekday in WEEKEND_INDICES)
 
 
 def compute_target_dates(today: date | None = None, *, lookahead_days: int = 10) -> List[TargetDate]:
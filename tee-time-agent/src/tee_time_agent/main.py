@@ -16,6 +16,7 @@ from google.genai import types
 from .adk_agent import TeeTimeAgent
 from .config import Settings
 from .date_window import TargetDate, compute_target_dates
+from .telegram import close_client
 
 
 def configure_logging(level: int = logging.INFO) -> None:
@@ -49,32 +50,35 @@ async def run(settings: Settings, targets: List[TargetDate]) -> None:
         targets=targets,
     )
 
-    async with InMemoryRunner(agent=agent, app_name="tee-time-agent") as runner:
-        user_id = settings.environment or "tee-time"
-        session_id = "tee-time-session"
-
-        await runner.session_service.create_session(
-            app_name=runner.app_name,
-            user_id=user_id,
-            session_id=session_id,
-        )
-
-        trigger = types.Content(
-            role="user",
-            parts=[types.Part.from_text("Run tee sheet check")],
-        )
-
-        async for event in runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=trigger,
-        ):
-            LOGGER.info(
-                "agent.event",
-                author=event.author,
-                text=_extract_event_text(event),
+    try:
+        async with InMemoryRunner(agent=agent, app_name="tee-time-agent") as runner:
+            user_id = settings.environment or "tee-time"
+            session_id = "tee-time-session"
+
+            await runner.session_service.create_session(
+                app_name=runner.app_name,
+                user_id=user_id,
+                session_id=session_id,
+            )
+
+            trigger = types.Content(
+                role="user",
+                parts=[types.Part.from_text("Run tee sheet check")],
             )
 
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=trigger,
+            ):
+                LOGGER.info(
+                    "agent.event",
+                    author=event.author,
+                    text=_extract_event_text(event),
+                )
+    finally:
+        await close_client()
+
 
 def parse_args() -> argparse.Namespace:
     """CLI argument parsing."""
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TeeTimeSlot:
     """Structured representation of a single tee time."""
 
@@ -17,7 +17,7 @@ class TeeTimeSlot:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TeeSheetAnalysis:
     """Result produced by the summarisation model."""
 
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import re
+import tempfile
 import textwrap
-from typing import Any, Optional
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 import httpx
+import orjson
 import structlog
-from tenacity import AsyncRetrying, RetryError, stop_after_attempt, wait_exponential
+from tenacity import (
+    AsyncRetrying,
+    RetryError,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from .config import Settings
 from .models import TeeSheetAnalysis, TeeTimeSlot
@@ -16,20 +28,226 @@ from .playwright_client import TeeSheetSnapshot
 
 LOGGER = structlog.get_logger(__name__)
 
+ProgressCallback = Callable[[int], None]
+
+# How many generated characters to accumulate between progress callbacks.
+PROGRESS_INTERVAL_CHARS = 500
+
+# Markdown code fence around a JSON body, for models that ignore JSON mode.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S | re.I)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry transport failures and server-side errors, but not client (4xx) errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+# Fields of one tee sheet result, shared by the single and batch schemas.
+_RESULT_SCHEMA_FIELDS = textwrap.dedent(
+    """
+    "summary": string,
+    "tee_times": [
+      {
+        "time": "HH:MM",
+        "status": string,
+        "available_slots": integer | null,
+        "is_bookable": boolean,
+        "notes": string | null
+      }
+    ],
+    "warnings": [string, ...]
+    """
+).strip()
+
+_REQUIREMENTS = textwrap.dedent(
+    """
+    - Keep "summary" under 160 characters.
+    - Include tee times that look bookable or notable; omit completed slots.
+    - Use warnings for login problems, competitions, or unexpected layouts.
+    - If no tee times are visible, return an empty list and explain in summary.
+    """
+).strip()
+
+_INTRO = (
+    "You are an assistant that extracts tee time availability from BRS Golf\n"
+    "tee sheet markup."
+)
+
+# Assembled once at import; ``_build_prompt`` only substitutes the per-snapshot fields
+# (%-style, so the JSON braces need no escaping).
+_PROMPT_TEMPLATE = (
+    f"{_INTRO} Only respond with valid JSON matching this schema:\n"
+    f"{{\n{textwrap.indent(_RESULT_SCHEMA_FIELDS, '  ')}\n}}\n\n"
+    f"Requirements:\n{_REQUIREMENTS}\n\n"
+    "Context:\n"
+    "- Date: %(date_iso)s (%(day_name)s)\n"
+    "- Source URL: %(url)s\n\n"
+    "%(sheet)s"
+)
+
+_BATCH_PROMPT = (
+    f"{_INTRO} Several tee sheets follow, each introduced by a\n"
+    '"[batch N]" marker. Only respond with valid JSON matching this schema,\n'
+    'with exactly one entry in "results" per batch marker:\n'
+    '{\n  "results": [\n    {\n      "index": integer,\n'
+    f"{textwrap.indent(_RESULT_SCHEMA_FIELDS, '      ')}\n"
+    "    }\n  ]\n}\n\n"
+    "Requirements:\n"
+    '- Set "index" to the N of the matching "[batch N]" marker.\n'
+    f"{_REQUIREMENTS}"
+)
+
 
 class OllamaClient:
     """Helper for interacting with an Ollama model."""
 
     def __init__(self, settings: Settings):
         self._settings = settings
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client reused across retries and snapshots."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=str(self._settings.ollama_base_url),
+                timeout=60.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
 
-    async def analyse_snapshot(self, snapshot: TeeSheetSnapshot) -> TeeSheetAnalysis:
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def analyse_snapshot(
+        self, snapshot: TeeSheetSnapshot, on_progress: Optional[ProgressCallback] = None
+    ) -> TeeSheetAnalysis:
         """Invoke the Ollama model to interpret the tee sheet snapshot."""
-        prompt = self._build_prompt(snapshot)
+        cached = self._load_cached(snapshot)
+        if cached is not None:
+            return cached
+
+        raw_text = await self._generate(
+            self._build_prompt(snapshot), on_progress=on_progress, date_iso=snapshot.date_iso
+        )
+        parsed = self._parse_response(raw_text)
+        analysis = self._to_analysis(snapshot, parsed, raw_text)
+        if parsed:
+            self._store_cached(snapshot, analysis)
+        return analysis
+
+    async def analyse_snapshots(
+        self, snapshots: list[TeeSheetSnapshot], on_progress: Optional[ProgressCallback] = None
+    ) -> list[TeeSheetAnalysis]:
+        """Interpret several tee sheets with a single model call.
+
+        Each snapshot is tagged with a ``[batch i]`` marker and the model returns one result per
+        index, so the model is loaded and prompted once regardless of how many dates are due.
+        Snapshots whose analysis is already cached are not sent at all.
+        """
+        cached = [self._load_cached(snapshot) for snapshot in snapshots]
+        pending = [snapshot for snapshot, analysis in zip(snapshots, cached) if analysis is None]
+        if not pending:
+            return [analysis for analysis in cached if analysis is not None]
+
+        if len(pending) == 1:
+            fresh = iter([await self.analyse_snapshot(pending[0], on_progress)])
+        else:
+            fresh = iter(await self._analyse_batch(pending, on_progress))
+        return [analysis if analysis is not None else next(fresh) for analysis in cached]
+
+    async def _analyse_batch(
+        self, snapshots: list[TeeSheetSnapshot], on_progress: Optional[ProgressCallback] = None
+    ) -> list[TeeSheetAnalysis]:
+        """Analyse ``snapshots`` with one batched prompt, caching each result the model returned."""
+        raw_text = await self._generate(
+            self._build_batch_prompt(snapshots),
+            on_progress=on_progress,
+            dates=[snapshot.date_iso for snapshot in snapshots],
+        )
+        parsed = self._parse_response(raw_text)
+
+        results: dict[int, dict[str, Any]] = {}
+        for item in parsed.get("results", []):
+            if not isinstance(item, dict):
+                continue
+            index = self._coerce_int(item.get("index"))
+            if index is not None:
+                results.setdefault(index, item)
+
+        analyses = []
+        for index, snapshot in enumerate(snapshots):
+            item = results.get(index)
+            if item is None:
+                LOGGER.warning("ollama.batch_result_missing", index=index, date_iso=snapshot.date_iso)
+                analyses.append(
+                    self._to_analysis(
+                        snapshot,
+                        {"warnings": ["Model response did not include this date."]},
+                        raw_text,
+                    )
+                )
+                continue
+            analysis = self._to_analysis(snapshot, item, raw_text)
+            # As on the single-snapshot path, only cache results the model actually filled in.
+            if item.get("summary") or item.get("tee_times"):
+                self._store_cached(snapshot, analysis)
+            analyses.append(analysis)
+        return analyses
+
+    def _cache_path(self, snapshot: TeeSheetSnapshot) -> Path:
+        """Location of the cached analysis for this model and tee sheet content.
+
+        The key covers exactly what the prompt carries for the sheet (the extracted rows, or the
+        capped HTML and text when no table was found), so any change the model would see misses.
+        """
+        key = hashlib.sha256(
+            f"{self._settings.ollama_model}|{snapshot.date_iso}|{self._sheet_section(snapshot)}".encode()
+        ).hexdigest()
+        return self._settings.cache_dir / f"{key}.json"
+
+    def _load_cached(self, snapshot: TeeSheetSnapshot) -> Optional[TeeSheetAnalysis]:
+        """Return a previous analysis of identical tee sheet markup, if one was cached."""
+        path = self._cache_path(snapshot)
+        try:
+            data = orjson.loads(path.read_bytes())
+            analysis = TeeSheetAnalysis(
+                **{**data, "tee_times": [TeeTimeSlot(**slot) for slot in data["tee_times"]]}
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            LOGGER.warning("ollama.cache_unreadable", path=str(path), error=str(exc))
+            return None
+        LOGGER.info("ollama.cache_hit", date_iso=snapshot.date_iso)
+        return analysis
+
+    def _store_cached(self, snapshot: TeeSheetSnapshot, analysis: TeeSheetAnalysis) -> None:
+        """Atomically persist ``analysis`` so an identical re-run skips the model."""
+        path = self._cache_path(snapshot)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as handle:
+                handle.write(orjson.dumps(asdict(analysis)))
+            os.replace(handle.name, path)
+        except OSError as exc:
+            LOGGER.warning("ollama.cache_write_failed", path=str(path), error=str(exc))
+
+    async def _generate(
+        self, prompt: str, on_progress: Optional[ProgressCallback] = None, **log_fields: Any
+    ) -> str:
+        """Send ``prompt`` to the model and return its raw text response."""
         payload = {
             "model": self._settings.ollama_model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
+            "format": "json",
             "options": {
                 "temperature": 0.2,
             },
@@ -38,11 +256,11 @@ class OllamaClient:
         LOGGER.info(
             "ollama.request.start",
             model=self._settings.ollama_model,
-            date_iso=snapshot.date_iso,
+            **log_fields,
         )
 
         try:
-            response_json = await self._invoke_generate(payload)
+            response_json = await self._invoke_generate(payload, on_progress)
         except RetryError as exc:
             raise RuntimeError("Failed communicating with Ollama after retries") from exc
 
@@ -52,9 +270,15 @@ class OllamaClient:
             preview=raw_text[:200],
             total_length=len(raw_text),
         )
+        return raw_text
 
-        parsed = self._parse_response(raw_text)
-
+    def _to_analysis(
+        self,
+        snapshot: TeeSheetSnapshot,
+        parsed: dict[str, Any],
+        raw_text: str,
+    ) -> TeeSheetAnalysis:
+        """Build a ``TeeSheetAnalysis`` from one parsed model result."""
         tee_times = [
             TeeTimeSlot(
                 time=str(item.get("time", "")).strip(),
@@ -88,72 +312,80 @@ class OllamaClient:
             model_raw_response=raw_text,
         )
 
-    async def _invoke_generate(self, payload: dict[str, Any]) -> dict[str, Any]:
+    async def _invoke_generate(
+        self, payload: dict[str, Any], on_progress: Optional[ProgressCallback] = None
+    ) -> dict[str, Any]:
         """Execute the Ollama generate call with retry behaviour."""
         async for attempt in AsyncRetrying(
-            wait=wait_exponential(multiplier=1, min=1, max=8),
+            wait=wait_exponential_jitter(initial=1, max=8, jitter=2),
             stop=stop_after_attempt(3),
+            retry=retry_if_exception(_is_retryable),
             reraise=True,
         ):
             with attempt:
-                async with httpx.AsyncClient(
-                    base_url=str(self._settings.ollama_base_url),
-                    timeout=60.0,
-                ) as client:
-                    response = await client.post("/api/generate", json=payload)
+                async with self.client.stream("POST", "/api/generate", json=payload) as response:
                     response.raise_for_status()
-                    return response.json()
+                    return await self._read_stream(response, on_progress)
         raise RuntimeError("Ollama generate invocation failed")  # safety net
 
+    @staticmethod
+    async def _read_stream(
+        response: httpx.Response, on_progress: Optional[ProgressCallback] = None
+    ) -> dict[str, Any]:
+        """Accumulate an NDJSON generate stream into a single non-streaming style result.
+
+        ``on_progress`` receives the number of characters generated so far, roughly every
+        ``PROGRESS_INTERVAL_CHARS``, so callers can report on long generations.
+        """
+        parts: list[str] = []
+        final: dict[str, Any] = {}
+        received = 0
+        reported = 0
+        async for line in response.aiter_lines():
+            if not line.strip():
+                continue
+            chunk = orjson.loads(line)
+            if "error" in chunk:
+                raise RuntimeError(f"Ollama generate failed: {chunk['error']}")
+            text = chunk.get("response", "")
+            parts.append(text)
+            received += len(text)
+            if on_progress is not None and received - reported >= PROGRESS_INTERVAL_CHARS:
+                reported = received
+                on_progress(received)
+            if chunk.get("done"):
+                final = chunk
+                break
+        LOGGER.debug("ollama.stream.complete", chunks=len(parts))
+        return {**final, "response": "".join(parts)}
+
     def _build_prompt(self, snapshot: TeeSheetSnapshot) -> str:
         """Construct the prompt sent to the Ollama model."""
-        truncated_html = snapshot.html_fragment
-        if len(truncated_html) > 30_000:
-            truncated_html = truncated_html[:30_000]
-
-        truncated_text = snapshot.text_fragment
-        if len(truncated_text) > 20_000:
-            truncated_text = truncated_text[:20_000]
-
-        return textwrap.dedent(
-            f"""
-            You are an assistant that extracts tee time availability from BRS Golf
-            tee sheet markup. Only respond with valid JSON matching this schema:
-            {{
-              "summary": string,
-              "tee_times": [
-                {{
-                  "time": "HH:MM",
-                  "status": string,
-                  "available_slots": integer | null,
-                  "is_bookable": boolean,
-                  "notes": string | null
-                }}
-              ],
-              "warnings": [string, ...]
-            }}
-
-            Requirements:
-            - Keep "summary" under 160 characters.
-            - Include tee times that look bookable or notable; omit completed slots.
-            - Use warnings for login problems, competitions, or unexpected layouts.
-            - If no tee times are visible, return an empty list and explain in summary.
-
-            Context:
-            - Date: {snapshot.date_iso} ({snapshot.day_name})
-            - Source URL: {snapshot.url}
-
-            Tee sheet HTML:
-            ```html
-            {truncated_html}
-            ```
-
-            Tee sheet visible text:
-            ```
-            {truncated_text}
-            ```
-            """
-        ).strip()
+        return _PROMPT_TEMPLATE % {
+            "date_iso": snapshot.date_iso,
+            "day_name": snapshot.day_name,
+            "url": snapshot.url,
+            "sheet": self._sheet_section(snapshot),
+        }
+
+    def _build_batch_prompt(self, snapshots: list[TeeSheetSnapshot]) -> str:
+        """Construct a single prompt covering every snapshot, tagged by batch index."""
+        sections = [
+            f"[batch {index}] date={snapshot.date_iso} day={snapshot.day_name} url={snapshot.url}\n"
+            f"{self._sheet_section(snapshot)}"
+            for index, snapshot in enumerate(snapshots)
+        ]
+        return "\n\n".join([_BATCH_PROMPT, *sections])
+
+    @staticmethod
+    def _sheet_section(snapshot: TeeSheetSnapshot) -> str:
+        """Render the captured tee sheet, preferring the extracted rows over raw markup."""
+        if snapshot.rows:
+            rows_json = orjson.dumps(snapshot.rows).decode()
+            return f"Tee sheet rows (JSON, one array of cell text per table row):\n{rows_json}"
+
+        # The table was not found, so fall back to whatever the page rendered (already capped at capture).
+        return f"Tee sheet HTML:\n{snapshot.html_fragment}\n\nTee sheet visible text:\n{snapshot.text_fragment}"
 
     @staticmethod
     def _coerce_int(value: Any) -> Optional[int]:
@@ -167,27 +399,19 @@ class OllamaClient:
 
     @staticmethod
     def _parse_response(raw_text: str) -> dict[str, Any]:
-        """Extract JSON from the Ollama model response."""
-        candidate = raw_text.strip()
-        if not candidate:
-            return {}
-
-        if "```" in candidate:
-            parts = candidate.split("```")
-            if len(parts) >= 3:
-                candidate = parts[1]
-            else:
-                candidate = parts[-1]
-        candidate = candidate.strip()
-
-        if candidate.lower().startswith("json"):
-            candidate = candidate[4:].strip()
-
+        """Decode the model's JSON-mode response, unwrapping a code fence if one slipped through."""
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
-            LOGGER.warning("ollama.json_decode_failed")
-            return {}
+            parsed = orjson.loads(raw_text)
+        except orjson.JSONDecodeError:
+            match = _FENCE_RE.search(raw_text)
+            try:
+                parsed = orjson.loads(match.group(1).strip()) if match else None
+            except orjson.JSONDecodeError:
+                parsed = None
+            if parsed is None:
+                LOGGER.warning("ollama.json_decode_failed")
+                return {}
+        return parsed if isinstance(parsed, dict) else {}
 
     @staticmethod
     def _fallback_summary(
@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import asyncio
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
 
 import structlog
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import Browser, BrowserContext, Page, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .config import Settings
 
 LOGGER = structlog.get_logger(__name__)
 
+# Only the tee sheet table is read, so skip anything that does not affect how it renders.
+# Stylesheets stay: innerText (used for rows and text) depends on CSS visibility, and without
+# them hidden responsive duplicates and screen-reader labels leak into the scraped cells.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "hotjar", "doubleclick")
 
-@dataclass
+# Cell text for every row of the tee sheet table, so the model gets a compact grid instead of markup.
+TABLE_ROWS_JS = """
+table => Array.from(table.rows)
+    .map(tr => Array.from(tr.cells).map(cell => cell.innerText.trim()))
+    .filter(cells => cells.some(Boolean))
+"""
+
+
+@dataclass(slots=True)
 class TeeSheetSnapshot:
     """HTML/inner text captured for a specific tee sheet."""
 
@@ -22,6 +41,7 @@ class TeeSheetSnapshot:
     day_name: str
     html_fragment: str
     text_fragment: str
+    rows: list[list[str]] = field(default_factory=list)
 
 
 class TeeSheetBrowser:
@@ -31,69 +51,147 @@ class TeeSheetBrowser:
         self._settings = settings
         self._playwright = None
         self._browser: Optional[Browser] = None
-        self._page: Optional[Page] = None
+        self._storage_state: Optional[dict[str, Any]] = None
+        self._login_lock = asyncio.Lock()
 
     async def __aenter__(self) -> "TeeSheetBrowser":
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(headless=self._settings.headless)
-        context = await self._browser.new_context()
-        self._page = await context.new_page()
-        await self._login()
+        # Snapshot pages get their own contexts, seeded with the logged-in cookies.
+        self._storage_state = self._load_storage_state()
+        if self._storage_state is None:
+            await self._refresh_session()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        if self._page:
-            await self._page.context.close()
         if self._browser:
             await self._browser.close()
         if self._playwright:
             await self._playwright.stop()
 
-    async def _login(self) -> None:
+    async def new_page(self) -> Page:
+        """Open a page in a fresh context that shares the logged-in session."""
+        if not self._storage_state:
+            raise RuntimeError("Playwright session has not been logged in")
+        context = await self._new_context(storage_state=self._storage_state)
+        return await context.new_page()
+
+    async def _new_context(self, **kwargs: Any) -> BrowserContext:
+        """Create a browser context on the shared browser."""
+        if not self._browser:
+            raise RuntimeError("Playwright browser has not been launched")
+        context = await self._browser.new_context(**kwargs)
+        await context.route("**/*", self._route_filter)
+        return context
+
+    @staticmethod
+    async def _route_filter(route: Route) -> None:
+        """Abort requests for assets and trackers that the scrape does not need."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _load_storage_state(self) -> Optional[dict[str, Any]]:
+        """Return the session saved by a previous run, if any."""
+        path = self._settings.storage_state_path
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("session.state_unreadable", path=str(path), error=str(exc))
+            return None
+        LOGGER.info("session.reused", path=str(path))
+        return state
+
+    async def _refresh_session(self) -> None:
+        """Log in from scratch and persist the resulting session to disk."""
+        path = self._settings.storage_state_path
+        context = await self._new_context()
+        try:
+            page = await context.new_page()
+            await self._login(page)
+            self._storage_state = await context.storage_state()
+        finally:
+            await context.close()
+        self._save_storage_state(path, self._storage_state)
+
+    @staticmethod
+    def _save_storage_state(path: Path, state: dict[str, Any]) -> None:
+        """Atomically write the session cookies, readable only by the current user."""
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file with 0600 permissions.
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(state, handle)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            LOGGER.warning("session.save_failed", path=str(path), error=str(exc))
+            return
+        LOGGER.info("session.saved", path=str(path))
+
+    async def _relogin(self, stale: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """Replace an expired session, logging in once even if several pages notice."""
+        async with self._login_lock:
+            if self._storage_state is stale:
+                await self._refresh_session()
+            assert self._storage_state is not None
+            return self._storage_state
+
+    async def _login(self, page: Page) -> None:
         """Log into the BRS member portal."""
-        if not self._page:
-            raise RuntimeError("Playwright page has not been initialised")
-
         LOGGER.info("login.start", url=self._settings.login_url)
-        await self._page.goto(str(self._settings.login_url), wait_until="domcontentloaded")
-        await self._page.wait_for_timeout(500)
+        await page.goto(str(self._settings.login_url), wait_until="domcontentloaded")
+        await page.wait_for_timeout(500)
 
-        await self._page.fill('input[name="login_form[username]"]', self._settings.brs_username)
-        await self._page.fill(
+        await page.fill('input[name="login_form[username]"]', self._settings.brs_username)
+        await page.fill(
             'input[name="login_form[password]"]',
             self._settings.brs_password.get_secret_value(),
         )
-        await self._page.click('button[name="login_form[login]"], button[type="submit"]')
-        await self._page.wait_for_load_state("networkidle", timeout=self._settings.timeout_seconds * 1000)
+        await page.click('button[name="login_form[login]"], button[type="submit"]')
+        await page.wait_for_load_state("networkidle", timeout=self._settings.timeout_seconds * 1000)
 
         # If we are still on the login page after submitting, treat it as a failure.
-        if "login" in self._page.url.lower():
-            LOGGER.error("login.failed", current_url=self._page.url)
+        if "login" in page.url.lower():
+            LOGGER.error("login.failed", current_url=page.url)
             raise RuntimeError("Login failed - still on login page after submission")
 
-        LOGGER.info("login.complete", redirected_to=self._page.url)
-
-    async def snapshot_for_date(self, *, date_iso: str, day_name: str, url: str) -> TeeSheetSnapshot:
-        """Navigate to a tee sheet and capture the key markup."""
-        if not self._page:
-            raise RuntimeError("Playwright page has not been initialised")
+        LOGGER.info("login.complete", redirected_to=page.url)
 
+    async def snapshot_for_date(self, page: Page, *, date_iso: str, day_name: str, url: str) -> TeeSheetSnapshot:
+        """Navigate ``page`` to a tee sheet and capture the key markup."""
         LOGGER.info("teesheet.load.start", url=url, date_iso=date_iso)
-        await self._page.goto(url, wait_until="domcontentloaded", timeout=self._settings.timeout_seconds * 1000)
-        await self._page.wait_for_load_state("networkidle", timeout=self._settings.timeout_seconds * 1000)
-
-        # Allow time for the client-side Vue app to render the table before we scrape it.
-        await self._page.wait_for_timeout(750)
-
-        table_locator = self._page.locator("table.border-collapse")
-        if await table_locator.count() == 0:
+        session = self._storage_state
+        await page.goto(url, wait_until="domcontentloaded", timeout=self._settings.timeout_seconds * 1000)
+        if "login" in page.url.lower():
+            # The saved session has expired; log in again and retry with fresh cookies.
+            LOGGER.warning("session.expired", url=url, redirected_to=page.url)
+            session = await self._relogin(session)
+            await page.context.add_cookies(session.get("cookies", []))
+            await page.goto(url, wait_until="domcontentloaded", timeout=self._settings.timeout_seconds * 1000)
+
+        # Wait on the table the Vue app renders rather than for the network to go quiet.
+        table = page.locator("table.border-collapse").first
+        html_limit = self._settings.prompt_html_chars
+        text_limit = self._settings.prompt_text_chars
+        try:
+            await table.wait_for(state="visible", timeout=self._settings.timeout_seconds * 1000)
+        except PlaywrightTimeoutError:
             LOGGER.warning("teesheet.table_missing", url=url)
-            html_fragment = await self._page.content()
-            text_fragment = await self._page.locator("main").inner_text(timeout=1000)
+            # Slice in the page so a multi-megabyte document is never copied across in full.
+            html_fragment = await page.evaluate(
+                "limit => document.documentElement.outerHTML.slice(0, limit)", html_limit
+            )
+            text_fragment = (await page.locator("main").inner_text(timeout=1000))[:text_limit]
+            rows: list[list[str]] = []
         else:
-            table = table_locator.nth(0)
-            html_fragment = await table.inner_html()
-            text_fragment = await table.inner_text()
+            html_fragment = (await table.inner_html())[:html_limit]
+            text_fragment = (await table.inner_text())[:text_limit]
+            rows = await table.evaluate(TABLE_ROWS_JS)
 
         LOGGER.info("teesheet.load.success", url=url, date_iso=date_iso)
 
@@ -103,4 +201,5 @@ class TeeSheetBrowser:
             day_name=day_name,
             html_fragment=html_fragment,
             text_fragment=text_fragment,
+            rows=rows,
         )
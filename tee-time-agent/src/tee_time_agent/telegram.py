@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Iterable, Optional
+
 import httpx
 import structlog
 
@@ -10,6 +13,33 @@ from .models import TeeSheetAnalysis, TeeTimeSlot
 
 LOGGER = structlog.get_logger(__name__)
 
+TELEGRAM_MESSAGE_LIMIT = 4096
+SECTION_SEPARATOR = "\n\n——\n\n"
+
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOCK = asyncio.Lock()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared Telegram HTTP client, creating it on first use."""
+    global _CLIENT
+    async with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT.is_closed:
+            _CLIENT = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=2),
+            )
+        return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared Telegram HTTP client if it was opened."""
+    global _CLIENT
+    async with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            await _CLIENT.aclose()
+            _CLIENT = None
+
 
 def format_message(analysis: TeeSheetAnalysis) -> str:
     """Build a human-friendly message for Telegram."""
@@ -39,6 +69,29 @@ def format_message(analysis: TeeSheetAnalysis) -> str:
     return "\n".join(lines).strip()
 
 
+def group_sections(sections: list[str], limit: int = TELEGRAM_MESSAGE_LIMIT) -> list[list[int]]:
+    """Group section indices, in order, into messages that fit Telegram's length limit."""
+    groups: list[list[int]] = []
+    length = 0
+    for index, section in enumerate(sections):
+        added = len(section) + (len(SECTION_SEPARATOR) if groups and groups[-1] else 0)
+        if groups and groups[-1] and length + added <= limit:
+            groups[-1].append(index)
+            length += added
+        else:
+            groups.append([index])
+            length = len(section)
+    return groups
+
+
+def join_sections(sections: Iterable[str], limit: int = TELEGRAM_MESSAGE_LIMIT) -> str:
+    """Join formatted sections into one message, truncating a single oversized section."""
+    text = SECTION_SEPARATOR.join(sections)
+    if len(text) > limit:
+        text = text[: limit - 1] + "…"
+    return text
+
+
 def format_slot(slot: TeeTimeSlot) -> str:
     """Format a single tee time slot for Telegram."""
     pieces = [slot.time, slot.status]
@@ -60,11 +113,11 @@ async def post_to_telegram(settings: Settings, text: str) -> None:
         "disable_web_page_preview": True,
     }
 
-    url = f"{settings.telegram_api_endpoint}/sendMessage"
+    url = settings.telegram_send_message_url
     LOGGER.info("telegram.send.start", url=url)
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.post(url, json=payload)
+    client = await _get_client()
+    response = await client.post(url, json=payload, timeout=15.0)
     if response.is_success:
         LOGGER.info("telegram.send.success")
         return